@@ -1,24 +1,33 @@
-import json
+import atexit
+import functools
 import os
 import logging
+import operator
+import queue
 import re
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.panel import Panel
-from rich.theme import Theme
-from rich.table import Table
-from rich.text import Text
-
-logging.basicConfig(filename='todo_list.log', level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+import sys
+from logging.handlers import QueueHandler, QueueListener
+import msgspec
+
+# Log records are queued and written to disk by a background listener thread.
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler('todo_list.log')
+file_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+listener = QueueListener(log_queue, file_handler)
+listener.start()
+atexit.register(listener.stop)
+
 logger = logging.getLogger(__name__)
-console = Console()
+logger.addHandler(QueueHandler(log_queue))
+logger.setLevel(logging.INFO)
 
 FILE_NAME = 'todo_list.json'
 MAX_DESCRIPTION_LENGTH = 200
 FORBIDDEN_CHARACTERS = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
-FORBIDDEN_URL_PATTERN = re.compile(r'http(s)?://')
-FORBIDDEN_WORDS = [
+FORBIDDEN_URL_PATTERN = re.compile(r'https?://')
+TASK_ID_SEPARATOR = re.compile(r'[,;\s]+')
+FORBIDDEN_WORDS = (
     'sex',
     'violence',
     'drugs',
@@ -29,30 +38,105 @@ FORBIDDEN_WORDS = [
     'explicit',
     'harassment',
     'discrimination',
-    'extremism']
+    'extremism')
+FORBIDDEN_WORDS_RE = re.compile(
+    '|'.join(re.escape(word) for word in FORBIDDEN_WORDS), re.IGNORECASE)
+YES_NO = ("yes", "no")
+MENU_CHOICES = ("1", "2", "3", "4", "5", "6", "7", "8")
 
 # Define themes
 THEMES = {
-    "dracula": Theme({
+    "dracula": {
         "panel.border": "red",
         "table.border": "cyan",
         "table.title": "bold yellow",
         "text": "white"
-    }),
-    "monokai": Theme({
+    },
+    "monokai": {
         "panel.border": "magenta",
         "table.border": "green",
         "table.title": "bold yellow",
         "text": "white"
-    }),
-    "solarized": Theme({
+    },
+    "solarized": {
         "panel.border": "blue",
         "table.border": "green",
         "table.title": "bold cyan",
         "text": "black"
-    })
+    }
 }
 
+
+# TaskManager status lines skip Rich markup and write ANSI colours directly,
+# falling back to plain text when the terminal cannot show them.
+def _supports_color():
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    if os.environ.get("TERM") == "dumb" or not sys.stdout.isatty():
+        return False
+    if sys.platform == "win32":
+        # Classic Windows consoles only understand escape codes once
+        # virtual terminal processing has been switched on.
+        import ctypes
+        from ctypes import wintypes
+
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(
+            handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    return True
+
+
+USE_COLOR = _supports_color()
+
+
+def _colored(code, text):
+    return f"\x1b[{code}m{text}\x1b[0m" if USE_COLOR else text
+
+
+def _red(text):
+    return _colored(31, text)
+
+
+def _green(text):
+    return _colored(32, text)
+
+
+def _yellow(text):
+    return _colored(33, text)
+
+
+def _blue(text):
+    return _colored(34, text)
+
+
+# Rich is imported on first use so importing this module stays cheap.
+@functools.lru_cache(maxsize=None)
+def get_console():
+    from rich.console import Console
+    console = Console()
+    # Pushed once on top of the base theme so choose_theme can pop/push it.
+    console.push_theme(get_theme("dracula"))
+    return console
+
+
+@functools.lru_cache(maxsize=None)
+def get_theme(name):
+    from rich.theme import Theme
+    return Theme(THEMES[name])
+
+
+def ask(prompt, **kwargs):
+    from rich.prompt import Prompt
+    return Prompt.ask(prompt, **kwargs)
+
+
 class InvalidGroupNameError(Exception):
     pass
 
@@ -61,58 +145,116 @@ class InvalidDescriptionError(Exception):
     pass
 
 
+class Task(msgspec.Struct):
+    id: int
+    description: str
+    completed: bool = False
+
+
+TASKS_DECODER = msgspec.json.Decoder(dict[str, list[Task]])
+TASKS_ENCODER = msgspec.json.Encoder()
+get_task_id = operator.attrgetter('id')
+
+
 class TaskManager:
     def __init__(self, file_name=FILE_NAME):
         self.file_name = file_name
         self.tasks = self.load_data()
+        self._dirty = False
+        self._index_tasks()
+
+    def _index_tasks(self):
+        self._next_id = {
+            group_name: max(map(get_task_id, task_list), default=0) + 1
+            for group_name, task_list in self.tasks.items()}
+        self._by_id = {
+            group_name: {task.id: task for task in task_list}
+            for group_name, task_list in self.tasks.items()}
+        self._incomplete = {
+            group_name: sum(not task.completed for task in task_list)
+            for group_name, task_list in self.tasks.items()}
+
+    def _delete_group(self, group_name):
+        del self.tasks[group_name]
+        del self._by_id[group_name]
+        self._next_id.pop(group_name, None)
+        del self._incomplete[group_name]
+
+    def _parse_task_ids(self, task_ids):
+        ids = set()
+        ignored = []
+        for token in TASK_ID_SEPARATOR.split(task_ids.strip()):
+            if token.isdecimal():
+                ids.add(int(token))
+            elif token:
+                ignored.append(token)
+        if ignored:
+            print(_yellow("Ignored invalid task IDs:"), ', '.join(ignored))
+        return ids
 
     def load_data(self):
         try:
             if os.path.exists(self.file_name):
-                with open(self.file_name, 'r') as file:
-                    return json.load(file)
+                with open(self.file_name, 'rb') as file:
+                    return TASKS_DECODER.decode(file.read())
             return {}
-        except json.JSONDecodeError:
-            console.print(
-                "[red]Error: The JSON file is corrupted or empty. Creating a new one.[/red]")
+        except msgspec.DecodeError:
+            print(
+                _red("Error: The JSON file is corrupted or empty. Creating a new one."))
             return {}
         except Exception as e:
-            console.print(
-                f"[red]An error occurred while loading data: {e}[/red]")
-            console.print(
-                "[red]Please check the log file 'todo_list.log' for more details.[/red]")
+            print(_red(f"An error occurred while loading data: {e}"))
+            print(
+                _red("Please check the log file 'todo_list.log' for more details."))
             logger.error(f"An error occurred while loading data: {e}")
             return {}
 
     def save_data(self):
+        # Write a sibling temp file and swap it in, so a crash mid-save
+        # never leaves a truncated data file behind.
+        tmp_name = self.file_name + '.tmp'
         try:
-            with open(self.file_name, 'w') as file:
-                json.dump(self.tasks, file, indent=4)
+            payload = msgspec.json.format(
+                TASKS_ENCODER.encode(self.tasks), indent=2)
+            with open(tmp_name, 'wb') as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_name, self.file_name)
+            self._dirty = False
         except IOError as e:
-            console.print(f"[red]Error saving data: {e}[/red]")
-            console.print(
-                "[red]Please check the log file 'todo_list.log' for more details.[/red]")
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            print(_red(f"Error saving data: {e}"))
+            print(
+                _red("Please check the log file 'todo_list.log' for more details."))
             logger.error(f"Error saving data: {e}")
 
+    def flush(self):
+        if self._dirty:
+            self.save_data()
+
     def reset_data(self):
         try:
             if os.path.exists(self.file_name):
-                if Prompt.ask(
+                if ask(
                     "Are you sure you want to reset all data? (yes/no)",
-                    choices=[
-                        "yes",
-                        "no"]) == "yes":
+                    choices=YES_NO) == "yes":
                     os.remove(self.file_name)
-                    console.print(
-                        "[yellow]All data has been reset and file removed.[/yellow]")
+                    self.tasks = {}
+                    self._dirty = False
+                    self._index_tasks()
+                    print(_yellow("All data has been reset and file removed."))
                 else:
-                    console.print("[yellow]Data reset canceled.[/yellow]")
+                    print(_yellow("Data reset canceled."))
             else:
-                console.print("[red]No data file found to reset.[/red]")
+                print(_red("No data file found to reset."))
         except IOError as e:
-            console.print(f"[red]Error resetting data: {e}[/red]")
-            console.print(
-                "[red]Please check the log file 'todo_list.log' for more details.[/red]")
+            print(_red(f"Error resetting data: {e}"))
+            print(
+                _red("Please check the log file 'todo_list.log' for more details."))
             logger.error(f"Error resetting data: {e}")
 
     def add_tasks(self, group_name, descriptions):
@@ -122,23 +264,27 @@ class TaskManager:
 
         if group_name not in self.tasks:
             self.tasks[group_name] = []
+            self._by_id[group_name] = {}
+            self._incomplete[group_name] = 0
 
-        start_id = max((task.get('id', 0)
-                       for task in self.tasks[group_name]), default=0) + 1
+        start_id = self._next_id.get(group_name, 1)
 
         for i, description in enumerate(descriptions, start=start_id):
             if self.is_valid_description(description):
-                self.tasks[group_name].append(
-                    {"id": i, "description": description, "completed": False})
+                task = Task(id=i, description=description)
+                self.tasks[group_name].append(task)
+                self._by_id[group_name][i] = task
+                self._next_id[group_name] = i + 1
+                self._incomplete[group_name] += 1
             else:
                 raise InvalidDescriptionError(
                     f"Invalid task description: {description}")
 
-        self.save_data()
+        self._dirty = True
         logger.info(
             f"Added tasks to group '{group_name}': {', '.join(descriptions)}")
-        console.print(
-            f"[green]Tasks added to group '{group_name}':[/green] {', '.join(descriptions)}")
+        print(
+            _green(f"Tasks added to group '{group_name}':"), ', '.join(descriptions))
 
     def edit_task(self, group_name, task_id, new_description):
         if not self.is_valid_description(new_description):
@@ -146,100 +292,124 @@ class TaskManager:
                 "Invalid task description. Please avoid special characters and inappropriate words.")
 
         if group_name in self.tasks:
-            for task in self.tasks[group_name]:
-                if task["id"] == task_id:
-                    task["description"] = new_description
-                    self.save_data()
-                    logger.info(
-                        f"Edited task in group '{group_name}': ID {task_id} -> {new_description}")
-                    console.print(
-                        f"[yellow]Task updated in group '{group_name}':[/yellow] ID {task_id} -> '{new_description}'")
-                    return
-            console.print("[red]Task not found in the group.[/red]")
+            task = self._by_id[group_name].get(task_id)
+            if task is not None:
+                task.description = new_description
+                self._dirty = True
+                logger.info(
+                    f"Edited task in group '{group_name}': ID {task_id} -> {new_description}")
+                print(
+                    _yellow(f"Task updated in group '{group_name}':"), f"ID {task_id} -> '{new_description}'")
+                return
+            print(_red("Task not found in the group."))
         else:
-            console.print("[red]Invalid group name.[/red]")
+            print(_red("Invalid group name."))
 
     def mark_tasks_complete(self, group_name, task_ids):
         if group_name in self.tasks:
-            ids = [int(id.strip()) for id in task_ids.split(',')]
-            for task in self.tasks[group_name]:
-                if task["id"] in ids:
-                    task["completed"] = True
-            self.save_data()
+            ids = sorted(self._parse_task_ids(task_ids))
+            task_index = self._by_id[group_name]
+            for id in ids:
+                task = task_index.get(id)
+                if task is not None and not task.completed:
+                    task.completed = True
+                    self._incomplete[group_name] -= 1
+            self._dirty = True
             logger.info(
                 f"Marked tasks in group '{group_name}' as complete: {', '.join(map(str, ids))}")
-            console.print(
-                f"[blue]Tasks marked as complete in group '{group_name}':[/blue] {', '.join(map(str, ids))}")
+            print(
+                _blue(f"Tasks marked as complete in group '{group_name}':"), ', '.join(map(str, ids)))
 
-            if all(task["completed"] for task in self.tasks[group_name]):
-                if Prompt.ask(
+            if self._incomplete[group_name] == 0:
+                if ask(
                     f"All tasks in group '{group_name}' are complete. Do you want to delete the group? (yes/no)",
-                    choices=[
-                        "yes",
-                        "no"]) == "yes":
-                    del self.tasks[group_name]
-                    self.save_data()
+                    choices=YES_NO) == "yes":
+                    self._delete_group(group_name)
                     logger.info(
                         f"Deleted group '{group_name}' after all tasks were completed")
-                    console.print(f"[red]Group '{group_name}' deleted.[/red]")
+                    print(_red(f"Group '{group_name}' deleted."))
         else:
-            console.print("[red]Invalid group name.[/red]")
+            print(_red("Invalid group name."))
 
     def delete_tasks(self, group_name, task_ids):
         if group_name in self.tasks:
-            ids = [int(id.strip())
-                   for id in task_ids.split(',') if id.strip().isdigit()]
-            self.tasks[group_name] = [
-                task for task in self.tasks[group_name] if task.get("id") not in ids]
-
-            if not self.tasks[group_name]:
-                if Prompt.ask(
+            ids = self._parse_task_ids(task_ids)
+            task_list = self.tasks[group_name]
+            task_index = self._by_id[group_name]
+            removed = False
+            for id in ids:
+                task = task_index.pop(id, None)
+                if task is not None:
+                    removed = True
+                    if not task.completed:
+                        self._incomplete[group_name] -= 1
+            if removed:
+                task_list[:] = [task for task in task_list if task.id not in ids]
+
+            if not task_list:
+                if ask(
                     f"Group '{group_name}' is now empty. Do you want to delete the group? (yes/no)",
-                    choices=[
-                        "yes",
-                        "no"]) == "yes":
-                    del self.tasks[group_name]
-                    console.print(f"[red]Group '{group_name}' deleted.[/red]")
+                    choices=YES_NO) == "yes":
+                    self._delete_group(group_name)
+                    print(_red(f"Group '{group_name}' deleted."))
 
-            self.save_data()
+            self._dirty = True
             logger.info(
-                f"Deleted tasks from group '{group_name}': {', '.join(map(str, ids))}")
-            console.print(
-                f"[red]Tasks deleted from group '{group_name}':[/red] {', '.join(map(str, ids))}")
+                f"Deleted tasks from group '{group_name}': {', '.join(map(str, sorted(ids)))}")
+            print(
+                _red(f"Tasks deleted from group '{group_name}':"), ', '.join(map(str, sorted(ids))))
         else:
-            console.print("[red]Invalid group name.[/red]")
+            print(_red("Invalid group name."))
 
     def is_valid_group_name(self, name):
-        return not (FORBIDDEN_CHARACTERS.search(name) or any(
-            word in name.lower() for word in FORBIDDEN_WORDS))
+        return not (FORBIDDEN_CHARACTERS.search(name)
+                    or FORBIDDEN_WORDS_RE.search(name))
 
     def is_valid_description(self, description):
-        return len(description) <= MAX_DESCRIPTION_LENGTH and not FORBIDDEN_URL_PATTERN.search(
-            description)
+        return (len(description) <= MAX_DESCRIPTION_LENGTH
+                and FORBIDDEN_URL_PATTERN.search(description) is None)
 
 
 class UserInterface:
+    _TASK_COLUMNS = (
+        ("ID", {"style": "cyan", "justify": "center"}),
+        ("Description", {"style": "magenta"}),
+        ("Status", {"justify": "center", "style": "green"}))
+
     def __init__(self, task_manager):
+        from rich.text import Text
+
         self.task_manager = task_manager
-        self.console = Console(theme=THEMES.get("dracula"))
-        
+        # Share one console so all UserInterface output follows the theme.
+        self.console = get_console()
+        self._done = Text("✓", style="green")
+        self._todo = Text("✗", style="red")
+
     def choose_theme(self):
         try:
-            theme_choice = Prompt.ask(
+            theme_choice = ask(
                 "Choose a theme dracula/monokai/solarized").strip().lower()
             if theme_choice in THEMES:
-                self.console = Console(theme=THEMES[theme_choice])
-                console.print(f"[green]Theme changed to {theme_choice}[/green]")
+                self.console.pop_theme()
+                self.console.push_theme(get_theme(theme_choice))
+                self.console.print(f"[green]Theme changed to {theme_choice}[/green]")
             else:
-                console.print("[red]Invalid theme choice. Please choose from dracula, monokai, solarized.[/red]")
+                self.console.print("[red]Invalid theme choice. Please choose from dracula, monokai, solarized.[/red]")
         except Exception as e:
-            console.print(
+            self.console.print(
                 f"[red]An error occurred while changing theme: {e}[/red]")
-            console.print(
+            self.console.print(
                 "[red]Please check the log file 'todo_list.log' for more details.[/red]")
             logger.error(f"An error occurred while changing theme: {e}")
 
     def display_tasks(self):
+        from rich.panel import Panel
+        from rich.table import Table
+
+        if not self.task_manager.tasks:
+            self.console.print("[yellow]No tasks yet.[/yellow]")
+            return
+
         try:
             for group_name, task_list in self.task_manager.tasks.items():
                 table = Table(
@@ -249,53 +419,52 @@ class UserInterface:
                     padding=(
                         1,
                         2))
-                table.add_column("ID", style="cyan", justify="center")
-                table.add_column("Description", style="magenta")
-                table.add_column("Status", justify="center", style="green")
+                for header, options in self._TASK_COLUMNS:
+                    table.add_column(header, **options)
 
                 for task in task_list:
-                    status = "✓" if task["completed"] else "✗"
-                    table.add_row(str(task['id']), task['description'], status)
+                    status = self._done if task.completed else self._todo
+                    table.add_row(str(task.id), task.description, status)
 
-                console.print(
+                self.console.print(
                     Panel(
                         table,
                         title=f"[bold yellow]Tasks in group '{group_name}'[/bold yellow]",
                         title_align="left",
                         border_style="bold yellow"))
         except Exception as e:
-            console.print(
+            self.console.print(
                 f"[red]An error occurred while displaying tasks: {e}[/red]")
-            console.print(
+            self.console.print(
                 "[red]Please check the log file 'todo_list.log' for more details.[/red]")
             logger.error(f"An error occurred while displaying tasks: {e}")
 
     def handle_add_task(self):
         try:
-            group_name = Prompt.ask("Enter the group name for these tasks")
+            group_name = ask("Enter the group name for these tasks")
             if not self.task_manager.is_valid_group_name(group_name):
-                console.print(
+                self.console.print(
                     "[red]Invalid group name. Please avoid special characters and inappropriate words.[/red]")
                 return
 
             descriptions = []
             while True:
-                description = Prompt.ask(
+                description = ask(
                     "Enter task description (or type 'done' to finish)")
                 if description.lower() == 'done':
                     break
                 if self.task_manager.is_valid_description(description):
                     descriptions.append(description)
                 else:
-                    console.print(
+                    self.console.print(
                         f"[red]Invalid task description: {description}[/red]")
 
             if descriptions:
                 self.task_manager.add_tasks(group_name, descriptions)
         except Exception as e:
-            console.print(
+            self.console.print(
                 f"[red]An error occurred while adding tasks: {e}[/red]")
-            console.print(
+            self.console.print(
                 "[red]Please check the log file 'todo_list.log' for more details.[/red]")
             logger.error(f"An error occurred while adding tasks: {e}")
             
@@ -305,44 +474,47 @@ class UserInterface:
 
     def handle_edit_task(self):
         try:
-            group_name = Prompt.ask("Enter the group name")
-            task_id = int(Prompt.ask("Enter task ID"))
-            new_description = Prompt.ask("Enter new task description")
+            group_name = ask("Enter the group name")
+            task_id = int(ask("Enter task ID"))
+            new_description = ask("Enter new task description")
             self.task_manager.edit_task(group_name, task_id, new_description)
         except Exception as e:
-            console.print(
+            self.console.print(
                 f"[red]An error occurred while editing tasks: {e}[/red]")
-            console.print(
+            self.console.print(
                 "[red]Please check the log file 'todo_list.log' for more details.[/red]")
             logger.error(f"An error occurred while editing tasks: {e}")
 
     def handle_mark_complete(self):
         try:
-            group_name = Prompt.ask("Enter the group name")
-            task_ids = Prompt.ask(
+            group_name = ask("Enter the group name")
+            task_ids = ask(
                 "Enter task IDs to mark as complete (comma-separated)")
             self.task_manager.mark_tasks_complete(group_name, task_ids)
         except Exception as e:
-            console.print(
+            self.console.print(
                 f"[red]An error occurred while marking tasks as complete: {e}[/red]")
-            console.print(
+            self.console.print(
                 "[red]Please check the log file 'todo_list.log' for more details.[/red]")
             logger.error(
                 f"An error occurred while marking tasks as complete: {e}")
 
     def handle_delete_task(self):
         try:
-            group_name = Prompt.ask("Enter the group name")
-            task_ids = Prompt.ask("Enter task IDs to delete (comma-separated)")
+            group_name = ask("Enter the group name")
+            task_ids = ask("Enter task IDs to delete (comma-separated)")
             self.task_manager.delete_tasks(group_name, task_ids)
         except Exception as e:
-            console.print(
+            self.console.print(
                 f"[red]An error occurred while deleting tasks: {e}[/red]")
-            console.print(
+            self.console.print(
                 "[red]Please check the log file 'todo_list.log' for more details.[/red]")
             logger.error(f"An error occurred while deleting tasks: {e}")
 
     def display_menu(self):
+        from rich.panel import Panel
+        from rich.table import Table
+
         menu_table = Table(
             title="[bold magenta]Todo List Menu[/bold magenta]",
             title_justify="left",
@@ -359,7 +531,7 @@ class UserInterface:
         menu_table.add_row("7", "Change Theme")
         menu_table.add_row("8", "Exit")
 
-        console.print(Panel(menu_table, border_style="bold blue"))
+        self.console.print(Panel(menu_table, border_style="bold blue"))
 
     def handle_choice(self, choice):
         if choice == "1":
@@ -374,15 +546,11 @@ class UserInterface:
             self.display_tasks()
         elif choice == "6":
             self.task_manager.reset_data()
-            return self.task_manager.load_data()  # Reload data after reset
         elif choice == "7":
             self.choose_theme()
         elif choice == "8":
-            console.print("[green]Exiting program...[/green]")
+            self.console.print("[green]Exiting program...[/green]")
             return None
-        else:
-            console.print(
-                "[red]Invalid choice. Please enter a number between 1 and 7.[/red]")
 
         return self.task_manager.tasks
 
@@ -391,18 +559,24 @@ def main():
     task_manager = TaskManager()
     ui = UserInterface(task_manager)
 
-    while True:
-        try:
-            ui.display_menu()
-            choice = Prompt.ask("Choose an option [1/2/3/4/5/6/7]")
-            task_manager.tasks = ui.handle_choice(choice)
-            if task_manager.tasks is None:
-                break
-        except Exception as e:
-            console.print(f"[red]An unexpected error occurred: {e}[/red]")
-            console.print(
-                "[red]Please check the log file 'todo_list.log' for more details.[/red]")
-            logger.error(f"An unexpected error occurred: {e}")
+    try:
+        while True:
+            try:
+                ui.display_menu()
+                choice = ask("Choose an option", choices=MENU_CHOICES)
+                tasks = ui.handle_choice(choice)
+                task_manager.flush()
+                if tasks is None:
+                    break
+                task_manager.tasks = tasks
+            except Exception as e:
+                ui.console.print(f"[red]An unexpected error occurred: {e}[/red]")
+                ui.console.print(
+                    "[red]Please check the log file 'todo_list.log' for more details.[/red]")
+                logger.error(f"An unexpected error occurred: {e}")
+    finally:
+        # Persist pending changes even on Ctrl+C or an unexpected exit.
+        task_manager.flush()
 
 
 if __name__ == "__main__":